@@ -1,7 +1,11 @@
+import os
+import sys
+
 import pandas as pd
 
-# Load the Excel file
-df = pd.read_excel("../Dataset/AuditoryTestResults.xlsx")  # Adjust path as needed
+# excel_cache.py is in md-rizve-hasan/, one level up from this script
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from excel_cache import load_cached
 
 # Define correct answers for each case
 correct_answers = {
@@ -25,17 +29,22 @@ labels = {
     'Case7': 'Normal'
 }
 
-# Compute accuracy
-results = []
-for case, correct_option in correct_answers.items():
-    total = df[case].notna().sum()
-    correct = (df[case].astype(str).str.strip().str.upper() == correct_option).sum()
-    accuracy = round((correct / total) * 100, 1) if total > 0 else 0
-    results.append({
-        'Case': f"{case} ({labels[case]})",
-        'Accuracy (%)': f"{accuracy}%"
-    })
-
-# Convert to DataFrame and display
-accuracy_df = pd.DataFrame(results)
+# Load the Excel file (only the case columns are needed)
+df = load_cached("../Dataset/AuditoryTestResults.xlsx", usecols=list(correct_answers))  # Adjust path as needed
+
+# Normalize the answers once for all cases
+cols = list(correct_answers)
+norm = df[cols].astype('string[pyarrow]').apply(lambda c: c.str.strip().str.upper())
+expected = pd.Series(correct_answers, dtype='string[pyarrow]')
+
+# Compute accuracy for every case at once
+total = norm.notna().sum()
+correct = norm.eq(expected).sum()
+accuracy = (correct / total * 100).round(1)
+
+# Build the table and display (cases with no answers are reported as 0%)
+accuracy_df = pd.DataFrame({
+    'Case': [f"{case} ({labels[case]})" for case in cols],
+    'Accuracy (%)': [f"{acc}%" if n > 0 else "0%" for acc, n in zip(accuracy, total)]
+})
 print(accuracy_df)
@@ -1,16 +1,25 @@
+import os
+import sys
+
+import numpy as np
 import pandas as pd
 
-# Load the updated Excel file
-df = pd.read_excel("../Dataset/AuditoryTestResults.xlsx")
+# excel_cache.py is in md-rizve-hasan/, one level up from this script
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from excel_cache import load_cached
 
+score_col = 'Rate the audio quality from 1 (very poor) to 10 (excellent)'
+
+# Load the updated Excel file
+df = load_cached("../Dataset/AuditoryTestResults.xlsx", usecols=[score_col])
 
 # Extract the numeric score from strings like "7/10"
-df['AudioScore'] = df['Rate the audio quality from 1 (very poor) to 10 (excellent)'] \
-    .astype(str).str.extract(r'(\d+)').astype(float)
+scores = df[score_col].astype('string[pyarrow]')
+df['AudioScore'] = pd.to_numeric(scores.str.split('/', n=1).str[0], errors='coerce').astype(float)
 
 # Classify participants based on score
-df['Device Quality'] = df['AudioScore'].apply(
-    lambda x: 'Bad Audio Device (1–6)' if x <= 6 else 'Good Audio Device (7–10)'
+df['Device Quality'] = np.where(
+    df['AudioScore'] <= 6, 'Bad Audio Device (1–6)', 'Good Audio Device (7–10)'
 )
 
 # Count participants and calculate percentages
@@ -1,25 +1,43 @@
+import os
+import sys
+
 import pandas as pd
 
+# excel_cache.py is in md-rizve-hasan/, one level up from this script
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from excel_cache import load_cached
+
 # Load the Excel file
-df = pd.read_excel("../Dataset/AuditoryTestResults.xlsx")  # Adjust path if needed
+df = load_cached("../Dataset/AuditoryTestResults.xlsx", usecols=['noiseEmojiRating'])  # Adjust path if needed
 
-# Normalize the noise rating responses
+# Normalize the noise rating responses by their text label, ignoring the emoji,
+# case and stray whitespace (e.g. "🙂\nNot noticeable", "😞\nNoticeable\n")
 mapping = {
-    "😃\nNo Noise": "1 = No Noise",
-    "😃\nNo noise": "1 = No Noise",
-    "😐\nLittle noticeable": "3 = Slightly Noticeable",
-    "😐\nSlightly noticeable": "3 = Slightly Noticeable",
-    "😞\nNoticeable": "4 = Noticeable",
-    "😠\nIntrusive": "5 = Intrusive",
-    "🙂\nNot Noticeable": "2 = Not Noticeable"
+    "no noise": "1 = No Noise",
+    "not noticeable": "2 = Not Noticeable",
+    "little noticeable": "3 = Slightly Noticeable",
+    "slightly noticeable": "3 = Slightly Noticeable",
+    "noticeable": "4 = Noticeable",
+    "intrusive": "5 = Intrusive"
 }
 
+# Noise levels in thesis order (1 → 5)
+levels = [
+    "1 = No Noise",
+    "2 = Not Noticeable",
+    "3 = Slightly Noticeable",
+    "4 = Noticeable",
+    "5 = Intrusive"
+]
+
 # Apply mapping
-df['Noise Level'] = df['noiseEmojiRating'].map(mapping)
+ratings = df['noiseEmojiRating'].astype('string[pyarrow]').str.strip()
+label = ratings.str.split('\n').str[-1].str.strip().str.casefold()
+df['Noise Level'] = pd.Categorical(label.map(mapping), categories=levels, ordered=True)
 
-# Count and sort noise level responses
-noise_counts = df['Noise Level'].value_counts().sort_index().reset_index()
-noise_counts.columns = ['Noise Level', 'Participants (n)']
+# Count noise level responses, keeping the category order
+noise_counts = df['Noise Level'].value_counts(sort=False).reindex(levels) \
+    .rename_axis('Noise Level').reset_index(name='Participants (n)')
 
 # Display table
 print(noise_counts)
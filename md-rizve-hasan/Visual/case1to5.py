@@ -1,50 +1,19 @@
 import pandas as pd
 
-# Load Excel file
-df = pd.read_excel("IshiharaResults.xlsx")
-
-# Correct answers to the 10 Ishihara plates
-correct_answers = {
-    'test1': '74',
-    'test2': '6',
-    'test3': '16',
-    'test4': '2',
-    'test5': '7',
-    'test6': '29',
-    'test7': '5',
-    'test8': '45',
-    'test9': '8',
-    'test10': '97'
-}
-
-# Calculate number of correct answers
-test_columns = list(correct_answers.keys())
-df[test_columns] = df[test_columns].astype(str)
-correct_series = pd.Series(correct_answers)
-df['Correct_Ishihara_Score'] = df[test_columns].eq(correct_series).sum(axis=1)
-
-# Classify participants
-df['Colorblind Status'] = df['Correct_Ishihara_Score'].apply(
-    lambda x: 'Colorblind' if x < 8 else 'Non-Colorblind'
-)
+from ishihara_common import load_scored
 
 # Define cases to analyze
 case_columns = ['Case 1', 'Case 2', 'Case 3', 'Case 4', 'Case 5']
 
-# Build the summary table
-rows = []
-for case in case_columns:
-    for group in ['Non-Colorblind', 'Colorblind']:
-        subset = df[df['Colorblind Status'] == group]
-        a_count = (subset[case].str.strip() == 'A').sum()
-        b_count = (subset[case].str.strip() == 'B').sum()
-        rows.append({
-            'Case': case,
-            'Colorblind Status': group,
-            'Option A': a_count,
-            'Option B': b_count
-        })
+# Load the Ishihara results with scores and colorblind status
+df = load_scored(usecols=case_columns)
+
+# Count A/B answers per case and group in a single pass
+long = df[['Colorblind Status'] + case_columns].melt('Colorblind Status', var_name='Case', value_name='Ans')
+counts = long.groupby(['Case', 'Colorblind Status', 'Ans']).size().unstack('Ans', fill_value=0)
 
-# Convert to DataFrame and print
-table_4_2 = pd.DataFrame(rows)
+# Build the summary table in case order, Non-Colorblind first
+order = pd.MultiIndex.from_product([case_columns, ['Non-Colorblind', 'Colorblind']], names=counts.index.names)
+counts = counts.reindex(index=order, columns=['A', 'B'], fill_value=0)
+table_4_2 = counts.rename(columns={'A': 'Option A', 'B': 'Option B'}).rename_axis(columns=None).reset_index()
 print(table_4_2)
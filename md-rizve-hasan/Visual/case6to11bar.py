@@ -1,21 +1,6 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-
-# Load Excel data
-df = pd.read_excel("IshiharaResults.xlsx")
-
-# Define correct answers for Ishihara test
-correct_answers = {
-    'test1': '74', 'test2': '6', 'test3': '16', 'test4': '2', 'test5': '7',
-    'test6': '29', 'test7': '5', 'test8': '45', 'test9': '8', 'test10': '97'
-}
 
-# Recalculate score and classify vision status
-test_columns = list(correct_answers.keys())
-df[test_columns] = df[test_columns].astype(str)
-correct_series = pd.Series(correct_answers)
-df['Correct_Ishihara_Score'] = df[test_columns].eq(correct_series).sum(axis=1)
-df['Colorblind Status'] = df['Correct_Ishihara_Score'].apply(lambda x: 'Colorblind' if x < 8 else 'Non-Colorblind')
+from ishihara_common import load_scored
 
 # Define correct option per test case
 correct_cases = {
@@ -25,21 +10,26 @@ correct_cases = {
     'Case 11': 'B'
 }
 
-# Count correct responses for each group and case
-data = []
-for case, correct_option in correct_cases.items():
-    for group in ['Colorblind', 'Non-Colorblind']:
-        subset = df[df['Colorblind Status'] == group]
-        correct_count = (subset[case].astype(str).str.strip() == correct_option).sum()
-        data.append({'Case': case, 'Group': group, 'Correct': correct_count})
+# Load the Ishihara results with scores and colorblind status
+df = load_scored(usecols=list(correct_cases))
 
-# Create DataFrame for plotting
-plot_df = pd.DataFrame(data)
+# Count correct responses for each group and case in a single pass
+long = df[['Colorblind Status'] + list(correct_cases)].melt('Colorblind Status', var_name='Case', value_name='Ans')
+long['Correct'] = long['Ans'] == long['Case'].map(correct_cases)
 
-# Pivot for grouped bar chart
-pivot_df = plot_df.pivot(index='Case', columns='Group', values='Correct').reindex(['Case 7', 'Case 8', 'Case 10', 'Case 11'])
+# Keep the cases in thesis order: Case 7 → 8 → 10 → 11
+long['Case'] = pd.Categorical(long['Case'], categories=list(correct_cases), ordered=True)
+
+# Unstack groups into columns for the grouped bar chart, keeping empty groups as zeros
+pivot_df = long.groupby(['Case', 'Colorblind Status'], observed=True)['Correct'].sum() \
+    .unstack('Colorblind Status').reindex(columns=['Colorblind', 'Non-Colorblind'], fill_value=0) \
+    .rename_axis(columns='Group')
+
+# Plot (matplotlib is only imported once there is a figure to draw)
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
+import matplotlib.pyplot as plt
 
-# Plot
 colors = {'Colorblind': '#6BAED6', 'Non-Colorblind': '#FDAE6B'}
 ax = pivot_df.plot(kind='bar', figsize=(8, 5), color=[colors[col] for col in pivot_df.columns])
 
@@ -51,4 +41,3 @@ plt.tight_layout()
 
 # Save figure
 plt.savefig("figure_4_4_correct_answers_grouped.png")
-plt.show()
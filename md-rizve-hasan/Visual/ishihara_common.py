@@ -0,0 +1,71 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# excel_cache.py is in md-rizve-hasan/, one level up from this module
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from excel_cache import load_cached
+
+# Correct answers to the 10 Ishihara plates
+CORRECT = {
+    'test1': '74', 'test2': '6', 'test3': '16', 'test4': '2', 'test5': '7',
+    'test6': '29', 'test7': '5', 'test8': '45', 'test9': '8', 'test10': '97'
+}
+EXPECTED = np.array([int(v) for v in CORRECT.values()], dtype=np.int16)
+
+# Stand-in for answers that are missing or not a whole number
+NO_ANSWER = -1
+
+# Participants scoring below this are classified as colorblind
+PASS_SCORE = 8
+
+# Sheets with at least this many rows are scored with the numba kernel, if installed
+JIT_MIN_ROWS = 100_000
+
+
+def _plate_answers(df):
+    """Return the plate answers as an int16 array, one row per participant."""
+    numeric = df[list(CORRECT)].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    valid = (numeric >= 0) & (numeric <= np.iinfo(np.int16).max) & (numeric % 1 == 0)
+    return np.where(valid, numeric, NO_ANSWER).astype(np.int16)
+
+
+def _score(answers):
+    """Return each participant's score and whether it is below PASS_SCORE."""
+    if len(answers) >= JIT_MIN_ROWS:
+        # Only large sheets are worth numba's import and compile time
+        try:
+            from ishihara_jit import score_and_classify
+        except ImportError:
+            pass
+        else:
+            return score_and_classify(answers, EXPECTED, PASS_SCORE)
+
+    score = (answers == EXPECTED).sum(axis=1, dtype=np.int16)
+    return score, score < PASS_SCORE
+
+
+def load_scored(path="IshiharaResults.xlsx", usecols=None):
+    """Load the Ishihara results and add the score and colorblind status columns.
+
+    Participants with fewer than PASS_SCORE correct plates are classified as
+    colorblind. The ``Case N`` answer columns are returned stripped, as
+    ``string[pyarrow]``. ``usecols`` lists the columns needed besides the plate
+    answers; all columns are loaded when it is None.
+    """
+    cols = list(CORRECT)
+    df = load_cached(path, usecols=None if usecols is None else cols + list(usecols))
+
+    # Strip the A/B case answers once so the scripts can compare them directly
+    case_cols = [c for c in df.columns if c.startswith('Case ')]
+    if case_cols:
+        df[case_cols] = df[case_cols].astype('string[pyarrow]').apply(lambda c: c.str.strip())
+
+    # Compare, count and threshold on a compact int16 array, without intermediate frames
+    score, colorblind = _score(_plate_answers(df))
+
+    df['Correct_Ishihara_Score'] = score
+    df['Colorblind Status'] = np.where(colorblind, 'Colorblind', 'Non-Colorblind')
+    return df
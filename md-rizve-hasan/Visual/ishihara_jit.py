@@ -0,0 +1,22 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def score_and_classify(answers, expected, threshold):
+    """Count correct plates per row and flag rows scoring below ``threshold``.
+
+    Fuses the compare, sum and threshold steps into one parallel loop, so no
+    intermediate arrays are allocated.
+    """
+    n, k = answers.shape
+    score = np.empty(n, np.int16)
+    below = np.empty(n, np.bool_)
+    for i in prange(n):
+        s = 0
+        for j in range(k):
+            if answers[i, j] == expected[j]:
+                s += 1
+        score[i] = s
+        below[i] = s < threshold
+    return score, below
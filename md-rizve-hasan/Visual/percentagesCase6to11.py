@@ -1,20 +1,6 @@
 import pandas as pd
 
-# Load Excel file (update path as needed)
-df = pd.read_excel("IshiharaResults.xlsx")
-
-# Define correct Ishihara answers
-correct_answers = {
-    'test1': '74', 'test2': '6', 'test3': '16', 'test4': '2', 'test5': '7',
-    'test6': '29', 'test7': '5', 'test8': '45', 'test9': '8', 'test10': '97'
-}
-
-# Compute Ishihara score and classify
-test_columns = list(correct_answers)
-df[test_columns] = df[test_columns].astype(str)
-correct_series = pd.Series(correct_answers)
-df['Correct_Ishihara_Score'] = df[test_columns].eq(correct_series).sum(axis=1)
-df['Colorblind Status'] = df['Correct_Ishihara_Score'].apply(lambda x: 'Colorblind' if x < 8 else 'Non-Colorblind')
+from ishihara_common import load_scored
 
 # Correct options for the test cases
 correct_cases = {
@@ -24,31 +10,33 @@ correct_cases = {
     'Case 11': 'B'
 }
 
-# Calculate correct percentage
-results = []
-for case, correct_option in correct_cases.items():
-    for group in ['Colorblind', 'Non-Colorblind']:
-        subset = df[df['Colorblind Status'] == group]
-        total = len(subset)
-        correct = (subset[case].astype(str).str.strip() == correct_option).sum()
-        percent = round((correct / total) * 100, 1) if total > 0 else 0
-        results.append({'Case': case, 'Group': group, 'Percent Correct': f"{percent}%"})
+# Load the Ishihara results with scores and colorblind status
+df = load_scored(usecols=list(correct_cases))
+
+# Mark each answer as correct or not in a single long frame
+case_columns = list(correct_cases)
+long = df[['Colorblind Status'] + case_columns].melt('Colorblind Status', var_name='Case', value_name='Ans')
+correct = long['Ans'] == long['Case'].map(correct_cases)
+long['Correct'] = correct.fillna(False)
 
-# Create percentage table
-table_4_4 = pd.DataFrame(results).pivot(index='Case', columns='Group', values='Percent Correct').reset_index()
-table_4_4.columns.name = None
+# Calculate correct percentage per case and group with one crosstab
+percent = pd.crosstab(long['Case'], long['Colorblind Status'], values=long['Correct'], aggfunc='mean') * 100
+
+# Create percentage table, rows in thesis order: Case 7 → 8 → 10 → 11
+percent = percent.reindex(index=case_columns, columns=['Colorblind', 'Non-Colorblind']).round(1)
+
+# Groups with no participants are reported as 0%
+table_4_4 = (percent.astype(str) + '%').where(percent.notna(), '0%')
+table_4_4 = table_4_4.rename_axis(index='Case', columns=None).reset_index()
 
 # Add Likely Reason column (you can modify these as needed)
-table_4_4['Likely Reason'] = [
-    "Some reliance on red-green contrast",
-    "Mostly accessible — color-independent cues may dominate",
-    "Strong red-green encoding, difficult for colorblind users",
-    "Similar limitations as Case 10"
-]
-
-# Reorder rows as in thesis: Case 7 → 8 → 10 → 11
-desired_order = ['Case 7', 'Case 8', 'Case 10', 'Case 11']
-table_4_4 = table_4_4.set_index('Case').loc[desired_order].reset_index()
+likely_reasons = {
+    'Case 7': "Some reliance on red-green contrast",
+    'Case 8': "Mostly accessible — color-independent cues may dominate",
+    'Case 10': "Strong red-green encoding, difficult for colorblind users",
+    'Case 11': "Similar limitations as Case 10"
+}
+table_4_4['Likely Reason'] = table_4_4['Case'].map(likely_reasons)
 
 # Display
 print(table_4_4)
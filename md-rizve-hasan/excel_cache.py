@@ -0,0 +1,57 @@
+import contextlib
+import hashlib
+import logging
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+CACHE_DIR = ".cache"
+
+log = logging.getLogger(__name__)
+
+
+def load_cached(path, usecols=None):
+    """Read an Excel workbook, reusing a Feather copy keyed on the file's hash.
+
+    The first call parses the workbook with the calamine engine and writes
+    ``.cache/<name>.<hash>.feather``; later calls on an unchanged file read the
+    Feather copy instead. If the sheet can't be stored as Feather, it is
+    returned uncached. Pass ``usecols`` to get back only those columns.
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    cache = os.path.join(CACHE_DIR, f"{os.path.basename(path)}.{digest}.feather")
+
+    if os.path.exists(cache):
+        try:
+            with pa.memory_map(cache) as source:
+                names = pa.ipc.open_file(source).schema.names
+            # A column the sheet doesn't have is the caller's error, not a damaged cache
+            missing = [c for c in usecols or [] if c not in names]
+            if missing:
+                raise KeyError(f"{missing} not found in {path}")
+            return pd.read_feather(cache, columns=usecols)
+        except (pa.ArrowException, OSError) as e:
+            # A damaged sidecar is treated as a miss and rewritten below
+            log.warning("Ignoring unreadable cache %s: %s", cache, e)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(cache)
+
+    # The whole sheet is cached so every script can share one sidecar
+    df = pd.read_excel(path, engine="calamine")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Write to a temp file and rename it into place, so an interrupted or
+    # concurrent run never leaves a partial sidecar behind
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        df.to_feather(tmp)
+        os.replace(tmp, cache)
+    except pa.ArrowException as e:
+        # e.g. a column mixing typed-out answers with numbers; skip the cache
+        log.warning("Not caching %s: %s", path, e)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return df if usecols is None else df[list(usecols)]
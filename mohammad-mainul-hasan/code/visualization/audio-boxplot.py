@@ -1,7 +1,5 @@
 # Import necessary libraries
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 audio_data_combined = {
     'Condition': [
@@ -24,7 +22,10 @@ df_audio_combined = pd.DataFrame(audio_data_combined)
 # Melt DataFrame for boxplot visualization
 df_audio_melted = df_audio_combined.melt(id_vars='Condition', var_name='Storage Provider', value_name='Average Fetch Time (ms)')
 
-# Plotting the boxplot
+# Plotting the boxplot (plotting libraries are only imported here)
+import matplotlib.pyplot as plt
+import seaborn as sns
+
 plt.figure(figsize=(16, 9))
 sns.boxplot(x='Storage Provider', y='Average Fetch Time (ms)', data=df_audio_melted)
 
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Explicitly provided throughput data recalculated
 data = {
@@ -50,7 +49,9 @@ data = {
 df = pd.DataFrame(data)
 df.set_index('Storage Solutions', inplace=True)
 
-# Plot with sky-blue bars, black edges, and labels
+# Plot with sky-blue bars, black edges, and labels (matplotlib is only imported here)
+import matplotlib.pyplot as plt
+
 fig, ax = plt.subplots(figsize=(12, 6))
 df.plot(kind='bar', ax=ax, color='skyblue', edgecolor='black')
 